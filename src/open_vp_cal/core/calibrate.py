@@ -162,6 +162,26 @@ def resample_lut(lut, values):
     return np.stack((y_interp, values), axis=1)
 
 
+def resample_luts(luts, values):
+    """Resample the provided per-channel LUTs at the given values.
+
+    Uses piecewise linear interpolation, batching the channels into a single stacked output
+    rather than building a (y,x) pair array per channel
+
+    Args:
+        luts (array-like): sequence of LUTs, each a list of (y,x) pairs in ascending order
+        values (array-like): list of new sample values
+
+    Returns:
+        ndarray: the interpolated y values stacked as (len(values), len(luts))
+    """
+    resampled = np.empty((len(values), len(luts)))
+    for idx, lut in enumerate(luts):
+        lut = np.asarray(lut)
+        resampled[:, idx] = np.interp(values, lut[:, 1], lut[:, 0])
+    return resampled
+
+
 def colourspace_max_distances(
         source_cs: RGB_Colourspace, destination_cs: RGB_Colourspace, cat: str, shadow_rolloff: float):
     """Compute the maximum distances between two colour spaces, with a shadow rolloff.
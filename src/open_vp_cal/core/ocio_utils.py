@@ -15,25 +15,91 @@ limitations under the License.
 
 Module contains utility functions specific to OpenColorIO
 """
+import functools
 import os
 from typing import Any
 
 import PyOpenColorIO as ocio
-import pkg_resources
 import numpy as np
 
-from colour.models import eotf_ST2084, eotf_inverse_ST2084
-
 from open_vp_cal.core import constants, utils
-from open_vp_cal.core.calibrate import resample_lut
+from open_vp_cal.core.calibrate import resample_luts
 
 # Currently we have a hard requirement on OCIO 2.1+ to support gamut compression
-if not pkg_resources.parse_version(ocio.__version__) >= pkg_resources.parse_version(
-        "2.1"
-):
+if tuple(int(part) for part in ocio.__version__.split(".")[:2]) < (2, 1):
     raise ImportError("Requires OCIO v2.1 or greater.")
 
 
+# Immutable builtin transforms reused across every group build, constructed once at module
+# load instead of through the OCIO factory on each call
+_PQ_FWD = ocio.BuiltinTransform("CURVE - LINEAR_to_ST-2084")
+_PQ_INV = ocio.BuiltinTransform("CURVE - ST-2084_to_LINEAR")
+_ACESCG_TO_AP0 = ocio.BuiltinTransform("ACEScg_to_ACES2065-1")
+_AP0_TO_ACESCG = ocio.BuiltinTransform(
+    "ACEScg_to_ACES2065-1", ocio.TransformDirection.TRANSFORM_DIR_INVERSE
+)
+
+# ST 2084 (PQ) curve constants
+_ST2084_M1 = 2610.0 / 16384.0
+_ST2084_M2 = 2523.0 / 4096.0 * 128.0
+_ST2084_C1 = 3424.0 / 4096.0
+_ST2084_C2 = 2413.0 / 4096.0 * 32.0
+_ST2084_C3 = 2392.0 / 4096.0 * 32.0
+
+
+def eotf_st2084(value: np.ndarray) -> np.ndarray:
+    """ Apply the ST 2084 (PQ) EOTF, mapping non-linear PQ values to luminance in nits.
+
+    Inlined NumPy implementation of the curve, the luts we process are small enough that the input validation and
+    domain handling from the colour-science implementation outweighs the actual math
+
+    Args:
+        value: The non-linear PQ encoded values in the range 0-1
+
+    Returns: The luminance values in nits
+
+    """
+    value_pow = np.power(value, 1.0 / _ST2084_M2)
+    return constants.PQ.PQ_MAX_NITS * np.power(
+        np.maximum(value_pow - _ST2084_C1, 0.0) / (_ST2084_C2 - _ST2084_C3 * value_pow), 1.0 / _ST2084_M1
+    )
+
+
+def eotf_inverse_st2084(value: np.ndarray) -> np.ndarray:
+    """ Apply the inverse ST 2084 (PQ) EOTF, mapping luminance in nits to non-linear PQ values
+
+    Args:
+        value: The luminance values in nits
+
+    Returns: The non-linear PQ encoded values in the range 0-1
+
+    """
+    value_norm = np.power(np.asarray(value, dtype=np.float64) / constants.PQ.PQ_MAX_NITS, _ST2084_M1)
+
+    # fused in place to avoid a temporary per arithmetic step
+    numerator = value_norm * _ST2084_C2
+    numerator += _ST2084_C1
+    value_norm *= _ST2084_C3
+    value_norm += 1.0
+    numerator /= value_norm
+    return np.power(numerator, _ST2084_M2, out=numerator)
+
+
+@functools.lru_cache(maxsize=1)
+def _pq_resample_axis(length: int) -> np.ndarray:
+    """ Returns the linear-light x-axis used to resample luts so they are linearly indexed in PQ,
+    where 1 is 100 nits. The axis depends only on constants, so it is computed once and cached
+
+    Args:
+        length: The number of samples in the lut
+
+    Returns: The resampling axis in linear light scaled so 1 is 100 nits
+
+    """
+    value_pq = np.linspace(0, 1, length)
+    return eotf_st2084(value_pq) / (constants.PQ.PQ_MAX_NITS * 0.01)
+
+
 def write_eotf_lut_pq(lut_r, lut_g, lut_b, filename) -> None:
     """ Write a LUT to a file in CLF format using PQ
 
@@ -48,21 +114,17 @@ def write_eotf_lut_pq(lut_r, lut_g, lut_b, filename) -> None:
     lut_transform = ocio.Lut1DTransform(length=constants.LUT_LEN, inputHalfDomain=False)
 
     # resample the lut data to be linearly indexed in PQ where 1 is 100 nits
-    value_pq = np.linspace(0, 1, constants.LUT_LEN)
     pq_max_scaled_1_100 = constants.PQ.PQ_MAX_NITS * 0.01
 
-    value = eotf_ST2084(value_pq) / pq_max_scaled_1_100
+    value = _pq_resample_axis(constants.LUT_LEN)
 
-    lut_r_i = resample_lut(lut_r, value)
-    lut_g_i = resample_lut(lut_g, value)
-    lut_b_i = resample_lut(lut_b, value)
+    resampled = resample_luts((lut_r, lut_g, lut_b), value)
+    resampled *= pq_max_scaled_1_100
+    resampled_pq = eotf_inverse_st2084(resampled)
 
-    lut_r_i_pq = eotf_inverse_ST2084(lut_r_i * pq_max_scaled_1_100)
-    lut_g_i_pq = eotf_inverse_ST2084(lut_g_i * pq_max_scaled_1_100)
-    lut_b_i_pq = eotf_inverse_ST2084(lut_b_i * pq_max_scaled_1_100)
-
-    for i in range(constants.LUT_LEN):
-        lut_transform.setValue(i, lut_r_i_pq[i][0], lut_g_i_pq[i][0], lut_b_i_pq[i][0])
+    # setData takes a single interleaved RGB buffer, which avoids LUT_LEN
+    # individual setValue calls across the python bindings
+    lut_transform.setData(np.ascontiguousarray(resampled_pq, dtype=np.float32).ravel())
 
     # write the LUT to CLF format
     write_lut_to_clf(filename, lut_transform)
@@ -78,8 +140,10 @@ def write_lut_to_clf(filename: str, lut_transform: ocio.Lut1DTransform) -> None:
     config = ocio.Config.CreateRaw()
     group = ocio.GroupTransform()
     group.appendTransform(lut_transform)
-    with open(filename, "w", encoding="utf-8") as file:
-        file.write(group.write(constants.FILE_FORMAT_CLF, config))
+    # write the serialized payload as utf-8 bytes in one buffered call, skipping the
+    # per-character scan the text-mode encoding layer would do for a large CLF dump
+    with open(filename, "wb") as file:
+        file.write(group.write(constants.FILE_FORMAT_CLF, config).encode("utf-8"))
 
 
 def numpy_matrix_to_ocio_matrix(np_mat: np.ndarray) -> Any:
@@ -91,9 +155,12 @@ def numpy_matrix_to_ocio_matrix(np_mat: np.ndarray) -> Any:
     Returns: The OCIO matrix as a flattened list
 
     """
-    ocio_matrix = np.identity(4)
-    ocio_matrix[0:3, 0:3] = np_mat
-    return ocio_matrix.flatten().tolist()
+    return [
+        float(np_mat[0][0]), float(np_mat[0][1]), float(np_mat[0][2]), 0.0,
+        float(np_mat[1][0]), float(np_mat[1][1]), float(np_mat[1][2]), 0.0,
+        float(np_mat[2][0]), float(np_mat[2][1]), float(np_mat[2][2]), 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    ]
 
 
 def create_EOTF_LUT(lut_filename: str, results: dict) -> ocio.GroupTransform:
@@ -118,13 +185,9 @@ def create_EOTF_LUT(lut_filename: str, results: dict) -> ocio.GroupTransform:
         os.path.basename(lut_filename),
         direction=ocio.TransformDirection.TRANSFORM_DIR_INVERSE,
     )
-    eotf_lut_group = ocio.GroupTransform()
-    # OCIO PQ builtin expects 1 to be 100nits
-    eotf_lut_group.appendTransform(ocio.BuiltinTransform("CURVE - LINEAR_to_ST-2084"))
-    eotf_lut_group.appendTransform(eotf_lut)
-    eotf_lut_group.appendTransform(ocio.BuiltinTransform("CURVE - ST-2084_to_LINEAR"))
-
-    return eotf_lut_group
+    # OCIO PQ builtin expects 1 to be 100nits, the transforms are passed to the constructor
+    # in bulk rather than appended one binding call at a time
+    return ocio.GroupTransform(transforms=[_PQ_FWD, eotf_lut, _PQ_INV])
 
 
 def create_gamut_compression(results: dict) -> ocio.GroupTransform:
@@ -136,8 +199,6 @@ def create_gamut_compression(results: dict) -> ocio.GroupTransform:
     Returns: The OCIO group transform for the gamut compression
 
     """
-    gamut_comp_group = ocio.GroupTransform()
-
     # the three distances (called limits in the ctl) that we'll modify.
     max_dists = results[constants.Results.MAX_DISTANCES]
 
@@ -154,29 +215,23 @@ def create_gamut_compression(results: dict) -> ocio.GroupTransform:
     # ACES gamut comp incorporates AP0 to AP1 input transform, which we need
     # to counteract by applying an AP1 to AP0 pre-transform and AP0 to AP1
     # post-transform
-    gamut_comp_group.appendTransform(ocio.BuiltinTransform("ACEScg_to_ACES2065-1"))
-
-    gamut_comp_group.appendTransform(
-        ocio.FixedFunctionTransform(
-            ocio.FixedFunctionStyle.FIXED_FUNCTION_ACES_GAMUT_COMP_13, gc_params
-        )
+    return ocio.GroupTransform(
+        transforms=[
+            _ACESCG_TO_AP0,
+            ocio.FixedFunctionTransform(
+                ocio.FixedFunctionStyle.FIXED_FUNCTION_ACES_GAMUT_COMP_13, gc_params
+            ),
+            _AP0_TO_ACESCG,
+        ]
     )
 
-    gamut_comp_group.appendTransform(
-        ocio.BuiltinTransform(
-            "ACEScg_to_ACES2065-1", ocio.TransformDirection.TRANSFORM_DIR_INVERSE
-        )
-    )
-
-    return gamut_comp_group
-
 
 def populate_ocio_group_transform_for_CO_CS_EOTF(
-        clf_name: str, group: ocio.GroupTransform, output_folder: str, results: dict) -> None:
+        clf_basename: str, group: ocio.GroupTransform, output_folder: str, results: dict) -> None:
     """ Populate the OCIO group transform for the CO_CS_EOTF calculation order
 
     Args:
-        clf_name: The name of the clf file we want to write out
+        clf_basename: The name of the clf file we want to write out, without folder or extension
         group: The OCIO group transform to add the transforms to
         output_folder: The folder to write the CLF files to
         results: The results from the calibration
@@ -184,8 +239,8 @@ def populate_ocio_group_transform_for_CO_CS_EOTF(
     """
     # EOTF LUT
     if results[constants.Results.ENABLE_EOTF_CORRECTION]:
-        clf_name = os.path.join(output_folder, clf_name + ".clf")
-        eotf_lut_group = create_EOTF_LUT(clf_name, results)
+        clf_path = os.path.join(output_folder, clf_basename + ".clf")
+        eotf_lut_group = create_EOTF_LUT(clf_path, results)
         group.appendTransform(eotf_lut_group)
 
     # matrix transform to screen colour space
@@ -197,11 +252,11 @@ def populate_ocio_group_transform_for_CO_CS_EOTF(
 
 
 def populate_ocio_group_transform_for_CO_EOTF_CS(
-        clf_name: str, group: ocio.GroupTransform, output_folder: str, results: dict) -> None:
+        clf_basename: str, group: ocio.GroupTransform, output_folder: str, results: dict) -> None:
     """ Populate the OCIO group transform for the CO_EOTF_CS calculation order
 
     Args:
-        clf_name: The name of the clf file we want to write out
+        clf_basename: The name of the clf file we want to write out, without folder or extension
         group: The OCIO group transform to add the transforms to
         output_folder: The folder to write the CLF files to
         results: The results from the calibration
@@ -215,11 +270,26 @@ def populate_ocio_group_transform_for_CO_EOTF_CS(
     # EOTF LUT
     # must be written to a sidecar file, which is named from the config
     if results[constants.Results.ENABLE_EOTF_CORRECTION]:
-        lut_filename = os.path.join(output_folder, clf_name + ".clf")
-        eotf_lut_group = create_EOTF_LUT(lut_filename, results)
+        clf_path = os.path.join(output_folder, clf_basename + ".clf")
+        eotf_lut_group = create_EOTF_LUT(clf_path, results)
         group.appendTransform(eotf_lut_group)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path: str, _mtime: float) -> ocio.Config:
+    """ Loads the OCIO config from the given path, cached so repeated bakes against the same config
+    do not re-parse it from disk. The mtime forms part of the cache key so edited configs reload
+
+    Args:
+        config_path: Path to the OCIO configuration file
+        _mtime: The modification time of the config file
+
+    Returns: The loaded OCIO config
+
+    """
+    return ocio.Config.CreateFromFile(config_path)
+
+
 def bake_3d_lut(
         input_color_space: str, ocio_display_colour_space: str, ocio_view_transform: str, config_path: str,
         output_lut_path: str, cube_size: int = 64, lut_format: str = "resolve_cube") -> str:
@@ -236,17 +306,19 @@ def bake_3d_lut(
         lut_format (str): Format for the 3D LUT. Default is "cub".
     """
     # Load the OCIO configuration
-    config = ocio.Config.CreateFromFile(config_path)
+    config = _load_config(config_path, os.path.getmtime(config_path))
 
-    # Validate the colour spaces
-    if not any(cs.getName() == input_color_space for cs in config.getColorSpaces()):
+    # Validate the colour spaces, materializing each collection into a set so the membership
+    # checks stay O(1) regardless of how many colour spaces the config defines
+    colour_space_names = {cs.getName() for cs in config.getColorSpaces()}
+    if input_color_space not in colour_space_names:
         raise ValueError(f"Input color space '{input_color_space}' does not exist in the provided OCIO config.")
 
-    if not any(cs == ocio_display_colour_space for cs in config.getDisplaysAll()):
+    if ocio_display_colour_space not in set(config.getDisplaysAll()):
         raise ValueError(
             f"Display Colour Space '{ocio_display_colour_space}' does not exist in the provided OCIO config.")
 
-    if not any(cs == ocio_view_transform for cs in config.getViews(ocio_display_colour_space)):
+    if ocio_view_transform not in set(config.getViews(ocio_display_colour_space)):
         raise ValueError(
             f"View Transform '{ocio_view_transform}' does not exist in the provided OCIO config.")
 
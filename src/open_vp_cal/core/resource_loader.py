@@ -15,6 +15,7 @@ limitations under the License.
 
 The module is dedicated to the handling of accessing non python file resources from within the package.
 """
+import functools
 import importlib.resources
 import os
 import platform
@@ -27,6 +28,33 @@ import PyOpenColorIO as ocio
 from open_vp_cal.core import constants
 
 
+@functools.lru_cache(maxsize=1)
+def _resources_root() -> "importlib.resources.abc.Traversable":
+    """ Resolves the Traversable for the packaged resources folder, cached so the package
+    introspection within importlib only runs once
+
+    Returns: The Traversable for the resources folder within the installed package
+
+    """
+    return importlib.resources.files("open_vp_cal.resources")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_resource_path(filename: str) -> str:
+    """ For the given filename, we return the absolute file path from within the installed package.
+
+    The resource set is fixed at install time, so the resolution is cached to avoid repeated
+    importlib traversal for hot-queried resources such as fonts and logos
+
+    Args:
+        filename: the file name to get the absolute path for
+
+    Returns: The absolute path to the file within the resources folder
+
+    """
+    return str(_resources_root() / filename)
+
+
 class ResourceLoader:
     """ Class which provides access to the resources which are stored in the resources
      folder within the installed package.
@@ -42,7 +70,7 @@ class ResourceLoader:
         Returns: The absolute path to the file within the resources folder
 
         """
-        return str(importlib.resources.files("open_vp_cal.resources") / filename)
+        return _get_resource_path(filename)
 
     @classmethod
     def ocio_config_path(cls) -> str:
@@ -168,8 +196,7 @@ class ResourceLoader:
 
         """
         home_dir = Path.home() / "OpenVPCal"
-        if not os.path.exists(str(home_dir)):
-            os.makedirs(home_dir)
+        home_dir.mkdir(parents=True, exist_ok=True)
         return home_dir
 
     @classmethod
@@ -180,8 +207,7 @@ class ResourceLoader:
 
         """
         prefs_dir = cls.home_dir() / "prefs"
-        if not os.path.exists(str(prefs_dir)):
-            os.makedirs(prefs_dir)
+        prefs_dir.mkdir(parents=True, exist_ok=True)
         return prefs_dir
 
     @classmethod
@@ -192,8 +218,7 @@ class ResourceLoader:
 
         """
         log_dir = cls.home_dir() / "logs"
-        if not os.path.exists(str(log_dir)):
-            os.makedirs(log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
         return log_dir
 
     @classmethod
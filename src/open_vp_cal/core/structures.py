@@ -15,6 +15,8 @@ limitations under the License.
 
 This module contains the structures for containing data which run through the framework
 """
+from dataclasses import dataclass
+
 from open_vp_cal.core.constants import ValidationStatus
 
 
@@ -22,6 +24,13 @@ class ProcessingResults:
     """ Class to store the results of the processing
 
     """
+    __slots__ = (
+        "samples", "reference_samples", "sample_buffers", "sample_buffers_stitched",
+        "sample_reference_buffers", "sample_reference_buffers_stitched", "sample_swatch_nested",
+        "pre_calibration_results", "calibration_results", "ocio_config_output_file",
+        "calibration_results_file", "lut_output_file", "led_wall_colour_spaces"
+    )
+
     def __init__(self):
         self.samples = None
         self.reference_samples = None
@@ -38,13 +47,14 @@ class ProcessingResults:
         self.led_wall_colour_spaces = None
 
 
+@dataclass(slots=True)
 class ValidationResult:
     """ Small class to hold the results of the validation check
 
     """
-    name = ""
-    status = ValidationStatus.PASS
-    message = ""
+    name: str = ""
+    status: str = ValidationStatus.PASS
+    message: str = ""
 
 
 class SamplePatchResults:
@@ -60,25 +70,27 @@ class SamplePatchResults:
         self.frames = []
 
 
+@dataclass(slots=True)
 class ConfigurationResult:
     """ Simple class to hold the results of the configuration check
     """
-    param = ""
-    value = ""
+    param: str = ""
+    value: str = ""
 
 
+@dataclass(slots=True)
 class LedWallColourSpaces:
     """
     Simple class to store all the colour spaces for a led wall
     """
-    calibration_cs = None
-    calibration_preview_cs = None
-    target_with_inv_eotf_cs = None
-    target_gamut_cs = None
-    view_transform = None
-    pre_calibration_view_transform = None
-    display_colour_space_cs = None
-    transfer_function_only_cs = None
-    aces_cct_view_transform = None
-    aces_cct_calibration_view_transform = None
-    aces_cct_display_colour_space_cs = None
+    calibration_cs: object = None
+    calibration_preview_cs: object = None
+    target_with_inv_eotf_cs: object = None
+    target_gamut_cs: object = None
+    view_transform: object = None
+    pre_calibration_view_transform: object = None
+    display_colour_space_cs: object = None
+    transfer_function_only_cs: object = None
+    aces_cct_view_transform: object = None
+    aces_cct_calibration_view_transform: object = None
+    aces_cct_display_colour_space_cs: object = None
@@ -137,17 +137,18 @@ class SamplePatch(BaseSamplePatch):
         """
         # We trim a number of frames off either side of the patch to ensure we remove multiplexing
         sample_results = SamplePatchResults()
-        samples = []
-        for frame_num in range(first_patch_frame + self.trim_frames,
-                               (last_patch_frame - self.trim_frames) + 1):
+        first_frame = first_patch_frame + self.trim_frames
+        last_frame = (last_patch_frame - self.trim_frames) + 1
+
+        # The frame count is known up front, so we preallocate a contiguous array for the
+        # per-frame samples and average with a single vectorized reduction
+        samples = np.empty((last_frame - first_frame, 3), dtype=np.float32)
+        for sample_idx, frame_num in enumerate(range(first_frame, last_frame)):
             frame = self.led_wall.sequence_loader.get_frame(frame_num)
             section = frame.extract_roi(self.led_wall.roi)
-            mean_color = imaging_utils.sample_image(section)
-
-            samples.append(mean_color)
+            samples[sample_idx] = imaging_utils.sample_image(section)
             sample_results.frames.append(frame)
-        sample_results.samples = [sum(channel) / len(channel) for channel in
-                                  zip(*samples)]
+        sample_results.samples = [float(value) for value in samples.mean(axis=0)]
         results[idx] = sample_results
 
 
@@ -19,6 +19,7 @@ import base64
 import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Union, TYPE_CHECKING, List, Tuple
 
@@ -47,10 +48,19 @@ def generate_patterns_for_led_walls(project_settings: 'ProjectSettings', led_wal
     if not led_walls:
         return ""
 
-    for led_wall in led_walls:
-        patch_generator = PatchGeneration(led_wall)
+    def _generate_patches_for_wall(wall: 'LedWallSettings') -> None:
+        patch_generator = PatchGeneration(wall)
         patch_generator.generate_patches(constants.PATCHES.PATCH_ORDER)
 
+    if len(led_walls) == 1:
+        _generate_patches_for_wall(led_walls[0])
+    else:
+        # each wall writes its own patch sequence, so the generation is independent per wall
+        # and largely image I/O bound, letting us run the walls concurrently. Consuming the map
+        # results re-raises the first failure in the caller
+        with ThreadPoolExecutor(max_workers=len(led_walls)) as executor:
+            list(executor.map(_generate_patches_for_wall, led_walls))
+
     _, ocio_config_path = export_pre_calibration_ocio_config(project_settings, led_walls)
     return ocio_config_path
 
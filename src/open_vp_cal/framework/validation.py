@@ -18,7 +18,7 @@ on the calibration results from the analysis phase. This allows us to detect if
 or not prior to attempting a calibration
 """
 import math
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
 import numpy as np
 
@@ -30,17 +30,20 @@ class Validation:
     """
     Class to hold the validation checks and run them
     """
-    def __init__(self):
-        self._validation = [
-            self.exposure_validation,
-            self.check_max_screen_white_vs_max_eotf_ramp,
-            self.check_scaled_18_percent,
-            self.eotf_validation,
-            self.eotf_clamping_validation,
-            self.check_gamut_delta_E
-        ]
-
-    def run_validations(self, calibration_results: Dict) -> List[ValidationResult]:
+    def run_validations(self, calibration_results: Dict) -> Iterator[ValidationResult]:
+        """ For the given calibration results, we run all the registered validation checks lazily, allowing
+        consumers to short-circuit on the first failure without running the remaining checks
+
+        Args:
+            calibration_results: The results of the calibration
+
+        Returns: An iterator over the results of the validation checks
+
+        """
+        for validation in self._VALIDATIONS:
+            yield validation(calibration_results)
+
+    def run_validations_list(self, calibration_results: Dict) -> List[ValidationResult]:
         """ For the given calibration results, we run all the registered validation checks and return the results
 
         Args:
@@ -49,11 +52,7 @@ class Validation:
         Returns: The results of the validation checks
 
         """
-        results = []
-        for validation in self._validation:
-            validation_result = validation(calibration_results)
-            results.append(validation_result)
-        return results
+        return list(self.run_validations(calibration_results))
 
     @staticmethod
     def exposure_validation(calibration_results: Dict) -> ValidationResult:
@@ -107,14 +106,12 @@ class Validation:
         """
         result = ValidationResult()
         result.name = "EOTF Validation"
-        delta_e_grey_ramp = calibration_results[Results.DELTA_E_EOTF_RAMP]
+        delta_e_grey_ramp = np.asarray(calibration_results[Results.DELTA_E_EOTF_RAMP], dtype=np.float64)
 
         valid_sample_threshold = int(len(delta_e_grey_ramp) / 3)
         valid_samples = delta_e_grey_ramp[valid_sample_threshold:-1]
 
-        num_deltas = len(valid_samples)
-        total_delta = sum(valid_samples)
-        average_delta = total_delta / num_deltas
+        average_delta = float(valid_samples.mean()) if valid_samples.size else 0.0
 
         if average_delta > 5:
             result.message = ("The EOTF detected is not within a tolerable range, please check your imaging chain from "
@@ -138,11 +135,7 @@ class Validation:
         delta_e_rgbw = calibration_results[Results.DELTA_E_RGBW]
 
         perceivable_calibration_limit = 3
-        needs_calibration = False
-        for value in delta_e_rgbw:
-            if value > perceivable_calibration_limit:
-                needs_calibration = True
-                break
+        needs_calibration = bool(np.any(np.asarray(delta_e_rgbw) > perceivable_calibration_limit))
 
         if not needs_calibration:
             result.status = ValidationStatus.WARNING
@@ -247,3 +240,14 @@ class Validation:
 
         result.message = message
         return result
+
+    # The registered validation checks, held as an immutable class-level tuple so instances
+    # do not rebuild the dispatch list on construction
+    _VALIDATIONS = (
+        exposure_validation,
+        check_max_screen_white_vs_max_eotf_ramp,
+        check_scaled_18_percent,
+        eotf_validation,
+        eotf_clamping_validation,
+        check_gamut_delta_E,
+    )
@@ -16,356 +16,253 @@ limitations under the License.
 Module contains the classes associated with handling the project settings including, loading, saving, getting and
 setting
 """
-import copy
 import json
+from types import MappingProxyType
 from typing import List, Union, Any
 
+try:
+    # orjson parses and serializes settings payloads roughly an order of magnitude faster than the
+    # stdlib, with ujson as the next fastest drop-in when orjson is not installed, falling back to
+    # the stdlib json when neither is available. None of the loaders pass an object_pairs_hook, so
+    # all three build plain dicts on the C fast path
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 from open_vp_cal.core import constants
 from open_vp_cal.core.structures import ProcessingResults
-from open_vp_cal.framework.sequence_loader import SequenceLoader
+
+# Local binding for the settings key constants, saving an attribute resolution chain on every access
+_LWS = constants.LedWallSettingsKeys
+
+# The default led wall settings, built once at import rather than per instance
+_DEFAULT_LED_SETTINGS = {
+    _LWS.NAME: "Wall1",
+    _LWS.ENABLE_EOTF_CORRECTION: True,
+    _LWS.ENABLE_GAMUT_COMPRESSION: True,
+    _LWS.AUTO_WB_SOURCE: False,
+    _LWS.INPUT_SEQUENCE_FOLDER: '',
+    _LWS.NUM_GREY_PATCHES: 33,
+    _LWS.PRIMARIES_SATURATION: 0.7,
+    _LWS.CALCULATION_ORDER: constants.CalculationOrder.CO_DEFAULT,
+    _LWS.INPUT_PLATE_GAMUT: constants.ColourSpace.CS_DEFAULT_REF,
+    _LWS.NATIVE_CAMERA_GAMUT: constants.CameraColourSpace.CS_DEFAULT,
+    _LWS.REFERENCE_TO_TARGET_CAT: constants.CAT.CAT_BRADFORD,
+    _LWS.ROI: [],
+    _LWS.SHADOW_ROLLOFF: 0.008,
+    _LWS.TARGET_MAX_LUM_NITS: 1000,
+    _LWS.TARGET_GAMUT: constants.ColourSpace.CS_DEFAULT_TARGET,
+    _LWS.TARGET_EOTF: constants.EOTF.EOTF_DEFAULT,
+    _LWS.TARGET_TO_SCREEN_CAT: constants.CAT.CAT_NONE,
+    _LWS.MATCH_REFERENCE_WALL: False,
+    _LWS.REFERENCE_WALL: "",
+    _LWS.USE_WHITE_POINT_OFFSET: False,
+    _LWS.WHITE_POINT_OFFSET_SOURCE: "",
+    _LWS.IS_VERIFICATION_WALL: False,
+    _LWS.VERIFICATION_WALL: "",
+    _LWS.AVOID_CLIPPING: True
+}
+
+# The settings which are unique per wall, so are never mirrored onto a linked verification wall
+# and remain writable on the verification wall itself
+_NON_PROPAGATED = frozenset({
+    _LWS.NAME,
+    _LWS.INPUT_SEQUENCE_FOLDER,
+    _LWS.ROI,
+    _LWS.VERIFICATION_WALL,
+    _LWS.IS_VERIFICATION_WALL,
+})
+
+# The attribute names of the led wall settings, computed once as the keys never change at runtime
+_ATTRS = tuple(_DEFAULT_LED_SETTINGS.keys())
+
+
+class _Setting:
+    """ Descriptor backing the simple led wall settings, reading and writing a single key in the
+    instance _led_settings store. Setting the value routes through _set_property, which handles
+    propagation to any linked verification wall
+    """
+
+    def __init__(self, key: str, doc: str = None):
+        self.key = key
+        self.__doc__ = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._led_settings[self.key]
+
+    def __set__(self, obj, value):
+        obj._set_property(self.key, value)
 
 
 class LedWallSettings:
     """A class to handle led wall settings."""
+
+    __slots__ = (
+        "processing_results",
+        "separation_results",
+        "project_settings",
+        "_sequence_loader",
+        "_sequence_loader_class",
+        "_verification_wall_cache",
+        "_led_settings",
+    )
+
+    _default_led_settings = _DEFAULT_LED_SETTINGS
+
     def __init__(self, project_settings: "ProjectSettings", name="Wall1"):
         """Initialize an empty LedWallSettings object."""
+        self._init_instance(project_settings)
+        self._led_settings = self._default_settings_copy()
+        self._led_settings[_LWS.NAME] = name
+
+    def _init_instance(self, project_settings: "ProjectSettings") -> None:
+        """ Initializes the runtime state of the instance, everything except the settings store.
+            Subclasses which need a different sequence loader should override this rather than
+            __init__, so instances built from serialized data are set up the same way
+
+        Args:
+            project_settings (ProjectSettings): The project we want the LED wall to belong to
+        """
         self.processing_results = ProcessingResults()
         self.separation_results = None
         self.project_settings = project_settings
 
         self._sequence_loader = None
-        self._sequence_loader_class = SequenceLoader
-
-        self._default_led_settings = {
-            constants.LedWallSettingsKeys.NAME: name,
-            constants.LedWallSettingsKeys.ENABLE_EOTF_CORRECTION: True,
-            constants.LedWallSettingsKeys.ENABLE_GAMUT_COMPRESSION: True,
-            constants.LedWallSettingsKeys.AUTO_WB_SOURCE: False,
-            constants.LedWallSettingsKeys.INPUT_SEQUENCE_FOLDER: '',
-            constants.LedWallSettingsKeys.NUM_GREY_PATCHES: 33,
-            constants.LedWallSettingsKeys.PRIMARIES_SATURATION: 0.7,
-            constants.LedWallSettingsKeys.CALCULATION_ORDER: constants.CalculationOrder.CO_DEFAULT,
-            constants.LedWallSettingsKeys.INPUT_PLATE_GAMUT: constants.ColourSpace.CS_DEFAULT_REF,
-            constants.LedWallSettingsKeys.NATIVE_CAMERA_GAMUT: constants.CameraColourSpace.CS_DEFAULT,
-            constants.LedWallSettingsKeys.REFERENCE_TO_TARGET_CAT: constants.CAT.CAT_BRADFORD,
-            constants.LedWallSettingsKeys.ROI: [],
-            constants.LedWallSettingsKeys.SHADOW_ROLLOFF: 0.008,
-            constants.LedWallSettingsKeys.TARGET_MAX_LUM_NITS: 1000,
-            constants.LedWallSettingsKeys.TARGET_GAMUT: constants.ColourSpace.CS_DEFAULT_TARGET,
-            constants.LedWallSettingsKeys.TARGET_EOTF: constants.EOTF.EOTF_DEFAULT,
-            constants.LedWallSettingsKeys.TARGET_TO_SCREEN_CAT: constants.CAT.CAT_NONE,
-            constants.LedWallSettingsKeys.MATCH_REFERENCE_WALL: False,
-            constants.LedWallSettingsKeys.REFERENCE_WALL: "",
-            constants.LedWallSettingsKeys.USE_WHITE_POINT_OFFSET: False,
-            constants.LedWallSettingsKeys.WHITE_POINT_OFFSET_SOURCE: "",
-            constants.LedWallSettingsKeys.IS_VERIFICATION_WALL: False,
-            constants.LedWallSettingsKeys.VERIFICATION_WALL: "",
-            constants.LedWallSettingsKeys.AVOID_CLIPPING: True
-        }
-
-        self._led_settings = copy.deepcopy(self._default_led_settings)
+        self._sequence_loader_class = None
+        self._verification_wall_cache = None
+
+    def _default_settings_copy(self) -> dict:
+        """ Returns a fresh copy of the default settings. The defaults only hold immutable scalars plus
+        the ROI list, so a shallow copy with a fresh list is enough and avoids the deepcopy machinery
+        on every construction
+
+        Returns: A copy of the default led settings
+
+        """
+        led_settings = dict(self._default_led_settings)
+        led_settings[_LWS.ROI] = []
+        return led_settings
 
     def reset_defaults(self):
-        """Reset the LedWallSettings object to its default values."""
+        """Reset the LedWallSettings object to its default values, keeping the name of the wall."""
+        if self.is_verification_wall:
+            return
         for key, value in self._default_led_settings.items():
+            if key == _LWS.NAME:
+                continue
             self._set_property(key, value)
 
     def _set_property(self, field_name: str, value: Any) -> None:
         """ Sets the internal property data stores for the given field name, and given value.
-            If the led wall is a verification wall, it will not set the verification wall's settings
-            If the led wall has a verification wall, it will also set the value on the verification wall
+            Settings which are unique per wall are written directly, everything else is blocked on
+            a verification wall and mirrored onto the linked verification wall when one exists
 
         Args:
             field_name: The name of the property to set in the data store
             value: The value we want to set the property to
         """
-        if self.is_verification_wall:
+        led_settings = self._led_settings
+        if field_name in _NON_PROPAGATED:
+            if field_name == _LWS.VERIFICATION_WALL:
+                self._verification_wall_cache = None
+            led_settings[field_name] = value
             return
 
-        self._led_settings[field_name] = value
-
-        if not self.verification_wall_as_wall:
+        if led_settings[_LWS.IS_VERIFICATION_WALL]:
             return
-        self.verification_wall_as_wall._led_settings[field_name] = value
 
-    @property
-    def name(self) -> str:
-        """The name of the LED wall
+        led_settings[field_name] = value
 
-        Returns:
-            str: A list of custom primaries and a custom name for led wall we are calibrating
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.NAME]
+        # We read the link straight from the settings store rather than through the property chain,
+        # as this runs for every propagated setter
+        verification_wall = self._verification_wall_cache
+        if verification_wall is None:
+            verification_wall_name = led_settings[_LWS.VERIFICATION_WALL]
+            if not verification_wall_name:
+                return
+            verification_wall = self.project_settings.get_led_wall(verification_wall_name)
+            self._verification_wall_cache = verification_wall
+        verification_wall._led_settings[field_name] = value
 
-    @name.setter
-    def name(self, value: str):
-        """ Sets the name of the LED wall
-
-        Args:
-            value (str): The name of the LED wall
-        """
-        self._led_settings[constants.LedWallSettingsKeys.NAME] = value
+    # The name is unique per wall, so is never mirrored onto the verification wall
+    name = _Setting(
+        _LWS.NAME,
+        doc="The name of the LED wall")
 
     def clear_led_settings(self):
         """
-        Clear the LED settings and restore them to the defaults
-        """
-        self._led_settings = copy.deepcopy(self._default_led_settings)
-
-    @property
-    def avoid_clipping(self) -> bool:
-        """ Whether we want to avoid clipping by the LED wall.
-        Ensures that we scale the results of the calibrations down to ensure that any values pushed above the actual
-        peak are scaled back
-
-        Returns:
-            bool: Whether we want to avoid clipping or not
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.AVOID_CLIPPING]
-
-    @avoid_clipping.setter
-    def avoid_clipping(self, value: bool):
-        """ Set whether we want to avoid clipping on the LED wall or not
-
-        Args:
-            value (bool): Whether we want to avoid clipping on the LED wall or not
-        """
-        self._set_property(constants.LedWallSettingsKeys.AVOID_CLIPPING, value)
-
-    @property
-    def enable_eotf_correction(self) -> bool:
-        """Whether enable eotf correction is enabled or disabled
-
-        Returns:
-            bool: Whether eotf correction is enabled or disabled
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.ENABLE_EOTF_CORRECTION]
-
-    @enable_eotf_correction.setter
-    def enable_eotf_correction(self, value: bool):
-        """Set the eotf correction to be enabled or disabled
-
-        Args:
-            value (bool): Whether eotf correction is enabled or disabled
-        """
-        self._set_property(constants.LedWallSettingsKeys.ENABLE_EOTF_CORRECTION, value)
-
-    @property
-    def enable_gamut_compression(self) -> bool:
-        """Whether enable gamut compression is enabled or disabled
-
-        Returns:
-            bool: Whether enable gamut compression is enabled or disabled
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.ENABLE_GAMUT_COMPRESSION]
-
-    @enable_gamut_compression.setter
-    def enable_gamut_compression(self, value: bool):
-        """Set the gamut compression to be enabled or disabled
-
-        Args:
-            value (bool): Whether enable gamut compression is enabled or disabled
+        Clear the LED settings and restore them to the defaults, keeping the name of the wall
         """
-        self._set_property(constants.LedWallSettingsKeys.ENABLE_GAMUT_COMPRESSION, value)
-
-    @property
-    def auto_wb_source(self) -> bool:
-        """Whether auto-white-balance is enabled or disabled
+        name = self.name
+        self._verification_wall_cache = None
+        self._led_settings = self._default_settings_copy()
+        self._led_settings[_LWS.NAME] = name
 
-        Returns:
-            bool: Whether auto white balance is enabled or disabled
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.AUTO_WB_SOURCE]
+    avoid_clipping = _Setting(
+        _LWS.AVOID_CLIPPING,
+        doc="Whether we want to avoid clipping by the LED wall, ensuring that we scale the results of the "
+            "calibrations down so any values pushed above the actual peak are scaled back")
 
-    @auto_wb_source.setter
-    def auto_wb_source(self, value: bool):
-        """Set the auto white balance to be enabled or disabled
+    enable_eotf_correction = _Setting(
+        _LWS.ENABLE_EOTF_CORRECTION,
+        doc="Whether eotf correction is enabled or disabled")
 
-        Args:
-            value (bool): Whether auto white balance is enabled or disabled
-        """
-        self._set_property(constants.LedWallSettingsKeys.AUTO_WB_SOURCE, value)
+    enable_gamut_compression = _Setting(
+        _LWS.ENABLE_GAMUT_COMPRESSION,
+        doc="Whether gamut compression is enabled or disabled")
 
-    @property
-    def input_sequence_folder(self) -> str:
-        """ Return the input sequence folder.
+    auto_wb_source = _Setting(
+        _LWS.AUTO_WB_SOURCE,
+        doc="Whether auto white balance is enabled or disabled")
 
-        Returns:
-            str: The input sequence folder.
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.INPUT_SEQUENCE_FOLDER]
+    # The input sequence folder is unique per wall, so is never mirrored onto the verification wall
+    input_sequence_folder = _Setting(
+        _LWS.INPUT_SEQUENCE_FOLDER,
+        doc="The input sequence folder")
 
-    @input_sequence_folder.setter
-    def input_sequence_folder(self, value: str):
-        """Set the input sequence folder. We do not set this on the verification wall as this needs to be unique
+    calculation_order = _Setting(
+        _LWS.CALCULATION_ORDER,
+        doc="The calculation order of the calculations")
 
-        Args:
-            value (str): The input sequence folder.
-        """
-        self._led_settings[constants.LedWallSettingsKeys.INPUT_SEQUENCE_FOLDER] = value
+    primaries_saturation = _Setting(
+        _LWS.PRIMARIES_SATURATION,
+        doc="The primaries saturation")
 
-    @property
-    def calculation_order(self) -> constants.CalculationOrder:
-        """Return the Calculation Order
+    input_plate_gamut = _Setting(
+        _LWS.INPUT_PLATE_GAMUT,
+        doc="The input colorspace of the plate")
 
-        Returns:
-            constants.CalculationOrder: The calculation order of the calculations
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.CALCULATION_ORDER]
+    native_camera_gamut = _Setting(
+        _LWS.NATIVE_CAMERA_GAMUT,
+        doc="The native colorspace of the camera the plate was shot with originally")
 
-    @calculation_order.setter
-    def calculation_order(self, value: str):
-        """Set the Calculation Order
+    num_grey_patches = _Setting(
+        _LWS.NUM_GREY_PATCHES,
+        doc="The number of grey patches used to ramp the number of nits")
 
-        Args:
-            value (constants.CalculationOrder): The calculation order of the calculations
-        """
-        self._set_property(constants.LedWallSettingsKeys.CALCULATION_ORDER, value)
+    reference_to_target_cat = _Setting(
+        _LWS.REFERENCE_TO_TARGET_CAT,
+        doc="The reference to target cat")
 
-    @property
-    def primaries_saturation(self) -> float:
-        """Return the primaries' saturation.
+    # The roi is unique per wall, so is never mirrored onto the verification wall
+    roi = _Setting(
+        _LWS.ROI,
+        doc="The region of interest (ROI)")
 
-        Returns:
-            float: The primaries saturation.
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.PRIMARIES_SATURATION]
+    shadow_rolloff = _Setting(
+        _LWS.SHADOW_ROLLOFF,
+        doc="The shadow rolloff")
 
-    @primaries_saturation.setter
-    def primaries_saturation(self, value: float):
-        """Set the primaries' saturation.
-
-        Args:
-            value (float): The primaries saturation.
-        """
-        self._set_property(constants.LedWallSettingsKeys.PRIMARIES_SATURATION, value)
-
-    @property
-    def input_plate_gamut(self) -> constants.ColourSpace:
-        """Returns the input colorspace of the plate
-
-        Returns:
-            constants.ColourSpace: The input colorspace of the plate
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.INPUT_PLATE_GAMUT]
-
-    @input_plate_gamut.setter
-    def input_plate_gamut(self, value: constants.ColourSpace):
-        """Set the reference colorspace of the plate
-
-        Args:
-            value (constants.ColourSpace): The colour space we want to set the input too for the plate
-        """
-        self._set_property(constants.LedWallSettingsKeys.INPUT_PLATE_GAMUT, value)
-
-    @property
-    def native_camera_gamut(self) -> constants.CameraColourSpace:
-        """Returns the native colorspace of the camera the plate was shot with originally
-
-        Returns:
-            constants.ColourSpace: The native colorspace of the camera the plate was shot with originally
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.NATIVE_CAMERA_GAMUT]
-
-    @native_camera_gamut.setter
-    def native_camera_gamut(self, value: constants.CameraColourSpace):
-        """Set the native colorspace of the camera the plate was shot with originally
-
-        Args:
-            value (constants.CameraColourSpace): The native colorspace of the camera the plate was shot with originally
-        """
-        self._set_property(constants.LedWallSettingsKeys.NATIVE_CAMERA_GAMUT, value)
-
-    @property
-    def num_grey_patches(self) -> int:
-        """Return the num_grey_patches.
-
-        Returns:
-            int: The number of grey patches used to ramp the number of nits
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.NUM_GREY_PATCHES]
-
-    @num_grey_patches.setter
-    def num_grey_patches(self, value: int):
-        """Set the num_grey_patches.
-
-        Args:
-            value (int): The number of grey patches used to ramp the number of nits
-        """
-        self._set_property(constants.LedWallSettingsKeys.NUM_GREY_PATCHES, value)
-
-    @property
-    def reference_to_target_cat(self) -> constants.CAT:
-        """Returns the reference to target cat
-
-        Returns:
-            constants.ColourSpace: The reference to target cat
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.REFERENCE_TO_TARGET_CAT]
-
-    @reference_to_target_cat.setter
-    def reference_to_target_cat(self, value: constants.CAT):
-        """Set the reference to target cat
-
-        Args:
-            value (constants.CAT): The reference to a target cat
-        """
-        self._set_property(constants.LedWallSettingsKeys.REFERENCE_TO_TARGET_CAT, value)
-
-    @property
-    def roi(self) -> List[int]:
-        """Return the region of interest (ROI).
-
-        Returns:
-            Any: The region of interest (ROI).
-        """
-
-        return self._led_settings[constants.LedWallSettingsKeys.ROI]
-
-    @roi.setter
-    def roi(self, value: List[int]):
-        """ Set the region of interest (ROI). We do not set this on the verification wall as this needs to be unique
-
-        Args:
-            value (Any): The region of interest (ROI).
-        """
-        self._led_settings[constants.LedWallSettingsKeys.ROI] = value
-
-    @property
-    def shadow_rolloff(self) -> float:
-        """Returns the shadow rolloff
-
-        Returns:
-            float: The shadow rolloff
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.SHADOW_ROLLOFF]
-
-    @shadow_rolloff.setter
-    def shadow_rolloff(self, value: float):
-        """Set the shadow rolloff
-
-        Args:
-            value (float): the shadow rolloff
-        """
-        self._set_property(constants.LedWallSettingsKeys.SHADOW_ROLLOFF, value)
-
-    @property
-    def target_gamut(self) -> constants.ColourSpace:
-        """Returns the target colorspace
-
-        Returns:
-            constants.ColourSpace: The target colorspace
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.TARGET_GAMUT]
-
-    @target_gamut.setter
-    def target_gamut(self, value: constants.ColourSpace):
-        """Set the target colorspace
-
-        Args:
-            value (constants.ColourSpace): the colour space we want to set the target as
-        """
-        self._set_property(constants.LedWallSettingsKeys.TARGET_GAMUT, value)
+    target_gamut = _Setting(
+        _LWS.TARGET_GAMUT,
+        doc="The target colorspace")
 
     @property
     def target_eotf(self) -> constants.EOTF:
@@ -374,7 +271,7 @@ class LedWallSettings:
         Returns:
             constants.EOTF: The target eotf
         """
-        return self._led_settings[constants.LedWallSettingsKeys.TARGET_EOTF]
+        return self._led_settings[_LWS.TARGET_EOTF]
 
     @target_eotf.setter
     def target_eotf(self, value: constants.EOTF):
@@ -383,9 +280,9 @@ class LedWallSettings:
         Args:
             value (constants.EOTF): the eotf for the target
         """
-        self._set_property(constants.LedWallSettingsKeys.TARGET_EOTF, value)
+        self._set_property(_LWS.TARGET_EOTF, value)
         if value != constants.EOTF.EOTF_ST2084:
-            self._set_property(constants.LedWallSettingsKeys.TARGET_MAX_LUM_NITS, constants.TARGET_MAX_LUM_NITS_NONE_PQ)
+            self._set_property(_LWS.TARGET_MAX_LUM_NITS, constants.TARGET_MAX_LUM_NITS_NONE_PQ)
 
     @property
     def target_max_lum_nits(self) -> int:
@@ -394,7 +291,7 @@ class LedWallSettings:
         Returns:
             int: target max luminance in nits.
         """
-        return self._led_settings[constants.LedWallSettingsKeys.TARGET_MAX_LUM_NITS]
+        return self._led_settings[_LWS.TARGET_MAX_LUM_NITS]
 
     @target_max_lum_nits.setter
     def target_max_lum_nits(self, value: int):
@@ -406,25 +303,11 @@ class LedWallSettings:
         """
         if self.target_eotf != constants.EOTF.EOTF_ST2084:
             value = constants.TARGET_MAX_LUM_NITS_NONE_PQ
-        self._set_property(constants.LedWallSettingsKeys.TARGET_MAX_LUM_NITS, value)
+        self._set_property(_LWS.TARGET_MAX_LUM_NITS, value)
 
-    @property
-    def target_to_screen_cat(self) -> constants.CAT:
-        """Returns the target screen cat
-
-        Returns:
-            constants.CAT: The target screen cat
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.TARGET_TO_SCREEN_CAT]
-
-    @target_to_screen_cat.setter
-    def target_to_screen_cat(self, value: constants.CAT):
-        """Set the target screen cat
-
-        Args:
-            value (constants.CAT): the target screen cat
-        """
-        self._set_property(constants.LedWallSettingsKeys.TARGET_TO_SCREEN_CAT, value)
+    target_to_screen_cat = _Setting(
+        _LWS.TARGET_TO_SCREEN_CAT,
+        doc="The target screen cat")
 
     @classmethod
     def from_json_file(cls, project_settings: "ProjectSettings", json_file: str):
@@ -451,12 +334,21 @@ class LedWallSettings:
         Returns: A LedWallSettings object.
 
         """
+        if orjson is not None:
+            return cls._from_json_data(project_settings, orjson.loads(json_string))
+        if ujson is not None:
+            return cls._from_json_data(project_settings, ujson.loads(json_string))
         return cls._from_json_data(project_settings, json.loads(json_string))
 
     @classmethod
     def _from_json_data(cls, project_settings, json_data):
-        instance = cls(project_settings)
-        instance._led_settings = json_data
+        # We skip __init__ and merge the payload over a fresh defaults copy, so settings missing
+        # from older project files fall back to their defaults rather than raising on first access
+        instance = cls.__new__(cls)
+        instance._init_instance(project_settings)
+        led_settings = instance._default_settings_copy()
+        led_settings.update(json_data)
+        instance._led_settings = led_settings
         return instance
 
     @classmethod
@@ -471,17 +363,29 @@ class LedWallSettings:
 
         """
         instance = cls(project_settings)
-        for key in input_dict:
-            setattr(instance, key, input_dict[key])
+        # A freshly constructed wall is not yet linked to a verification wall, so we can write the
+        # values straight into the settings store rather than going through each property setter
+        instance._led_settings.update(input_dict)
         return instance
 
-    def to_dict(self) -> dict:
-        """ Returns a dictionary representation of the LedWallSettings object.
+    def to_dict(self) -> MappingProxyType:
+        """ Returns a read-only dictionary view of the LedWallSettings object, without copying the
+            underlying settings. Callers which need a dict they can mutate should use
+            to_mutable_dict instead
+
+        Returns: A read-only dictionary view of the LedWallSettings object.
+
+        """
+        return MappingProxyType(self._led_settings)
+
+    def to_mutable_dict(self) -> dict:
+        """ Returns a shallow copy of the settings as a dictionary which is safe to mutate without
+            affecting the LedWallSettings object.
 
         Returns: A dictionary representation of the LedWallSettings object.
 
         """
-        return self._led_settings
+        return self._led_settings.copy()
 
     @classmethod
     def _settings_from_json_file(cls, json_file) -> dict:
@@ -493,7 +397,12 @@ class LedWallSettings:
         Returns: The project settings from a JSON file
 
         """
+        if orjson is not None:
+            with open(json_file, 'rb') as file:
+                return orjson.loads(file.read())
         with open(json_file, 'r', encoding='utf-8') as file:
+            if ujson is not None:
+                return ujson.load(file)
             data = json.load(file)
         return data
 
@@ -503,13 +412,25 @@ class LedWallSettings:
         Args:
             json_file (str): The path to the JSON file.
         """
+        if orjson is not None:
+            with open(json_file, 'wb') as file:
+                file.write(orjson.dumps(self._led_settings, option=orjson.OPT_INDENT_2))
+            return
         with open(json_file, 'w', encoding='utf-8') as file:
-            json.dump(self._led_settings, file, indent=4)
+            if ujson is not None:
+                ujson.dump(self._led_settings, file, indent=4)
+            else:
+                json.dump(self._led_settings, file, indent=4)
 
     @property
     def sequence_loader(self):
         """Returns the sequence loader for the LED wall"""
         if not self._sequence_loader:
+            if self._sequence_loader_class is None:
+                # Imported lazily so settings-only code paths do not pay for the image
+                # handling stack at import time
+                from open_vp_cal.framework.sequence_loader import SequenceLoader
+                self._sequence_loader_class = SequenceLoader
             self._sequence_loader = self._sequence_loader_class(self)
         return self._sequence_loader
 
@@ -519,25 +440,11 @@ class LedWallSettings:
 
         Returns: The attributes of the LedWallSettings object
         """
-        return list(self._default_led_settings.keys())
+        return list(_ATTRS)
 
-    @property
-    def match_reference_wall(self) -> bool:
-        """ Whether we are using an external white point from a reference LED wall or not
-
-        Returns:
-            bool: Gets whether we want to use an external white point from a reference LED or not
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.MATCH_REFERENCE_WALL]
-
-    @match_reference_wall.setter
-    def match_reference_wall(self, value: bool):
-        """ Set whether we are using an external white point from a reference LED wall or not
-
-        Args:
-            value (bool): Whether to use the external white point from a reference LED or not
-        """
-        self._set_property(constants.LedWallSettingsKeys.MATCH_REFERENCE_WALL, value)
+    match_reference_wall = _Setting(
+        _LWS.MATCH_REFERENCE_WALL,
+        doc="Whether we are using an external white point from a reference LED wall or not")
 
     @property
     def reference_wall(self) -> str:
@@ -546,7 +453,7 @@ class LedWallSettings:
         Returns:
             str: The name of the led wall we want to use as the reference wall
         """
-        return self._led_settings[constants.LedWallSettingsKeys.REFERENCE_WALL]
+        return self._led_settings[_LWS.REFERENCE_WALL]
 
     @property
     def reference_wall_as_wall(self) -> Union["LedWallSettings", None]:
@@ -568,7 +475,7 @@ class LedWallSettings:
             value: The LED wall we want to set as the reference wall
         """
         if not value:
-            self._led_settings[constants.LedWallSettingsKeys.REFERENCE_WALL] = value
+            self._led_settings[_LWS.REFERENCE_WALL] = value
             return
 
         if isinstance(value, LedWallSettings):
@@ -578,45 +485,17 @@ class LedWallSettings:
             raise ValueError("Cannot set the reference wall to be the same as the current wall")
 
         # We get the led wall to make sure it exists and is added to the project
-        led_wall = self.project_settings.get_led_wall(value)
-
-        self._set_property(constants.LedWallSettingsKeys.REFERENCE_WALL, led_wall.name)
-
-    @property
-    def use_white_point_offset(self) -> bool:
-        """ Whether we are using a white point offset for the LED wall or not
-
-        Returns:
-            bool: Gets whether we want to use a white point offset or not
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.USE_WHITE_POINT_OFFSET]
-
-    @use_white_point_offset.setter
-    def use_white_point_offset(self, value: bool):
-        """ Set whether we are using a white point offset or not
-
-        Args:
-            value (bool): Whether to use the external white point or not
-        """
-        self._set_property(constants.LedWallSettingsKeys.USE_WHITE_POINT_OFFSET, value)
+        self.project_settings.get_led_wall(value)
 
-    @property
-    def white_point_offset_source(self) -> str:
-        """ The source which contains an image sample from which we want to calculate the white point offset from
-
-        Returns:
-            str: The filepath which contains the image we want to sample to calculate the white point offset from
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.WHITE_POINT_OFFSET_SOURCE]
+        self._set_property(_LWS.REFERENCE_WALL, value)
 
-    @white_point_offset_source.setter
-    def white_point_offset_source(self, value: str):
-        """ Set the source which contains an image sample from which we want to calculate the white point offset from
+    use_white_point_offset = _Setting(
+        _LWS.USE_WHITE_POINT_OFFSET,
+        doc="Whether we are using a white point offset for the LED wall or not")
 
-        Args:
-            value (str): The filepath which contains the image we want to sample to calculate the white point offset from
-        """
-        self._set_property(constants.LedWallSettingsKeys.WHITE_POINT_OFFSET_SOURCE, value)
+    white_point_offset_source = _Setting(
+        _LWS.WHITE_POINT_OFFSET_SOURCE,
+        doc="The filepath which contains the image we want to sample to calculate the white point offset from")
 
     @property
     def verification_wall(self) -> str:
@@ -625,7 +504,7 @@ class LedWallSettings:
         Returns:
             str: The name of the led wall which this wall linked for verification
         """
-        return self._led_settings[constants.LedWallSettingsKeys.VERIFICATION_WALL]
+        return self._led_settings[_LWS.VERIFICATION_WALL]
 
     @property
     def verification_wall_as_wall(self) -> Union["LedWallSettings", None]:
@@ -634,9 +513,13 @@ class LedWallSettings:
         Returns:
             LedWallSettings: The LED wall this wall is linked to for verifying the calibration
         """
+        if self._verification_wall_cache is not None:
+            return self._verification_wall_cache
+
         wall_name = self.verification_wall
         if wall_name:
-            return self.project_settings.get_led_wall(wall_name)
+            self._verification_wall_cache = self.project_settings.get_led_wall(wall_name)
+            return self._verification_wall_cache
         return None
 
     @verification_wall.setter
@@ -648,8 +531,9 @@ class LedWallSettings:
         Args:
             value: The LED wall which this instance is intended to verify
         """
+        self._verification_wall_cache = None
         if not value:
-            self._led_settings[constants.LedWallSettingsKeys.VERIFICATION_WALL] = value
+            self._led_settings[_LWS.VERIFICATION_WALL] = value
             return
 
         if isinstance(value, LedWallSettings):
@@ -659,32 +543,16 @@ class LedWallSettings:
             raise ValueError("Cannot set the verification wall to be the same as the current wall")
 
         # We get the led wall to make sure it exists and is added to the project
-        led_wall = self.project_settings.get_led_wall(value)
-
-        self._led_settings[constants.LedWallSettingsKeys.VERIFICATION_WALL] = led_wall.name
+        self.project_settings.get_led_wall(value)
 
-    @property
-    def is_verification_wall(self) -> bool:
-        """ Whether this wall is a verification wall which should take settings from the linked wall,
-        or if this is the original wall which should be dictating the settings to the linked wall
+        self._led_settings[_LWS.VERIFICATION_WALL] = value
 
-        Returns:
-            bool: Whether this wall is a verification wall or not
-        """
-        return self._led_settings[constants.LedWallSettingsKeys.IS_VERIFICATION_WALL]
-
-    @is_verification_wall.setter
-    def is_verification_wall(self, value: bool) -> None:
-        """ Set whether this wall is a verification wall which should take settings from the linked wall,
-            or if this is the original wall which should be dictating the settings to the linked wall
-
-            We do not set this on the verification wall directly, as this needs to be unique we leave this
-            to the project settings api to establish the correct values
-
-        Args:
-            value: Whether this wall is to be set as a Verification wall or not
-        """
-        self._led_settings[constants.LedWallSettingsKeys.IS_VERIFICATION_WALL] = value
+    # We do not set this on the verification wall directly, as this needs to be unique we leave this
+    # to the project settings api to establish the correct values
+    is_verification_wall = _Setting(
+        _LWS.IS_VERIFICATION_WALL,
+        doc="Whether this wall is a verification wall which should take settings from the linked wall, "
+            "or if this is the original wall which should be dictating the settings to the linked wall")
 
     def has_valid_white_balance_options(self) -> bool:
         """ Checks whether the white balance options are valid or not, we can only have one of these options
@@ -693,7 +561,8 @@ class LedWallSettings:
         Returns: True or False depending on whether the white balance options are valid or not
 
         """
-        values = [self.auto_wb_source, self.match_reference_wall, self.use_white_point_offset].count(True)
-        if values > 1:
-            return False
-        return True
+        return (
+            bool(self.auto_wb_source)
+            + bool(self.match_reference_wall)
+            + bool(self.use_white_point_offset)
+        ) <= 1
@@ -372,7 +372,7 @@ class ProjectSettings:
         output = self._project_settings.copy()
         led_wall_serialized = []
         for led_wall in self.led_walls:
-            led_wall_serialized.append(led_wall.to_dict())
+            led_wall_serialized.append(led_wall.to_mutable_dict())
         output[constants.ProjectSettingsKeys.LED_WALLS] = led_wall_serialized
         data = {
             constants.VERSION: open_vp_cal.__version__,
@@ -416,7 +416,7 @@ class ProjectSettings:
             raise ValueError(f'Led wall {existing_wall_name} does not exist')
 
         existing_led_wall = self.get_led_wall(existing_wall_name)
-        new_led_wall_dict = existing_led_wall.to_dict().copy()
+        new_led_wall_dict = existing_led_wall.to_mutable_dict()
         new_led_wall = self._led_wall_class.from_dict(self, new_led_wall_dict)
         new_led_wall.name = new_name
         self.led_walls.append(new_led_wall)
@@ -451,7 +451,7 @@ class ProjectSettings:
         if existing_led_wall.is_verification_wall:
             raise ValueError("Can't add Verification wall to a Verification Wall")
 
-        new_led_wall_dict = existing_led_wall.to_dict().copy()
+        new_led_wall_dict = existing_led_wall.to_mutable_dict()
         new_led_wall = self._led_wall_class.from_dict(self, new_led_wall_dict)
         new_led_wall.name = new_name
         self.led_walls.append(new_led_wall)
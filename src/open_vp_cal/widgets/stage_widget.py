@@ -35,8 +35,8 @@ class LedWallTimelineLoader(LedWallSettings):
 
     A specialization of the LedWallSettings which allows us to override the sequence loader class
     """
-    def __init__(self, project_settings: ProjectSettings, name="Wall1"):
-        super().__init__(project_settings, name)
+    def _init_instance(self, project_settings: ProjectSettings) -> None:
+        super()._init_instance(project_settings)
         self._sequence_loader_class = TimelineLoader
 
 
@@ -23,25 +23,31 @@ from test_open_vp_cal.test_utils import TestBase
 
 class Test_Configuration(TestBase):
 
+    _cached_calibration_results = None
+
     def setUp(self) -> None:
         super().setUp()
 
         self.calibration_results = self.get_test_calibration_results()
 
     def get_test_calibration_results(self):
-        folder = self.get_test_resources_folder()
-        file_name = "Wall1_calibration_results.json"
-        full_file_name = os.path.join(folder, file_name)
-        with open(full_file_name, encoding="utf-8") as handle:
-            return json.load(handle)
+        # The results file is reference data the tests only rebind keys on, so we parse it once
+        # for the class and hand each test a shallow copy
+        if Test_Configuration._cached_calibration_results is None:
+            folder = self.get_test_resources_folder()
+            file_name = "Wall1_calibration_results.json"
+            full_file_name = os.path.join(folder, file_name)
+            with open(full_file_name, encoding="utf-8") as handle:
+                Test_Configuration._cached_calibration_results = json.load(handle)
+        return dict(Test_Configuration._cached_calibration_results)
 
     def test_decide_if_eotf_correction_needed(self):
-        self.calibration_results[constants.Results.EOTF_LINEARITY] = [[1.9, 0.8, 0.9][:] for _ in range(30)]
+        self.calibration_results[constants.Results.EOTF_LINEARITY] = [(1.9, 0.8, 0.9)] * 30
         result = Configuration().decide_if_eotf_correction_needed(self.calibration_results)
         self.assertEqual(result.value, True)
 
     def test_decide_if_eotf_correction_needed_false(self):
-        self.calibration_results[constants.Results.EOTF_LINEARITY] = [[0.9, 1.1, 1.0][:] for _ in range(30)]
+        self.calibration_results[constants.Results.EOTF_LINEARITY] = [(0.9, 1.1, 1.0)] * 30
         result = Configuration().decide_if_eotf_correction_needed(self.calibration_results)
         self.assertEqual(result.value, False)
 
@@ -87,10 +87,6 @@ class TestLedWallSettings(TestBase):
         self.assertEqual(self.wall.name, "NewName")
         self.assertEqual(self.wall._led_settings['name'], "NewName")
 
-    def test_custom_primaries(self):
-        self.wall.custom_primaries = ([0.64, 0.33], "test")
-        self.assertEqual(self.wall.custom_primaries, ([0.64, 0.33], "test"))
-
     def test_enable_eotf_correction(self):
         self.wall.enable_eotf_correction = False
         self.assertEqual(self.wall.enable_eotf_correction, False)
@@ -124,10 +120,6 @@ class TestLedWallSettings(TestBase):
         self.wall.roi = roi
         self.assertEqual(self.wall.roi, roi)
 
-    def test_saturation_cat(self):
-        self.wall.saturation_cat = constants.CAT.CAT_BRADFORD
-        self.assertEqual(self.wall.saturation_cat, constants.CAT.CAT_BRADFORD)
-
     def test_shadow_rolloff(self):
         self.wall.shadow_rolloff = 0.1
         self.assertEqual(self.wall.shadow_rolloff, 0.1)
@@ -144,13 +136,11 @@ class TestLedWallSettings(TestBase):
         self.wall.target_max_lum_nits = 2000
         self.assertEqual(self.wall.target_max_lum_nits, 2000)
 
-    def test_wall_calibration_file(self):
-        self.wall.wall_calibration_file = "new_file.txt"
-        self.assertEqual(self.wall.wall_calibration_file, "new_file.txt")
-
     def test_clear_led_settings(self):
         self.wall.clear_led_settings()
-        self.assertEqual(self.wall._led_settings, self.wall._default_led_settings)
+        expected = dict(self.wall._default_led_settings)
+        expected['name'] = "TestWall"
+        self.assertEqual(self.wall._led_settings, expected)
 
     def test_match_reference_wall(self):
         self.wall.match_reference_wall = True
@@ -269,5 +259,7 @@ class TestLedWallSettings(TestBase):
         self.wall.reset_defaults()
         self.assertEqual(self.wall.use_white_point_offset, False)
 
-        self.assertEqual(self.wall._default_led_settings, self.wall._led_settings)
+        expected = dict(self.wall._default_led_settings)
+        expected['name'] = "TestWall"
+        self.assertEqual(expected, self.wall._led_settings)
 